@@ -4,12 +4,61 @@ Settings management for Kindle to Obsidian.
 Handles loading, saving, and providing defaults for all configuration options.
 """
 
+import functools
+import json
 import os
 import platform
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
+
+def _yaml():
+    """Import yaml lazily, preferring libyaml's C loader/dumper."""
+    import yaml
+    try:
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:
+        # PyYAML built without libyaml
+        return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
+# platform.system() can shell out on some platforms; resolve it once
+_SYSTEM = platform.system()
+
+def _format_scalar(value: Any) -> str:
+    """Format one scalar for the hand-written config emitter."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if value is None:
+        return 'null'
+    # Strings are always emitted double-quoted: YAML 1.1 resolves plain
+    # scalars like "no", "on", or "2024" to bool/int on reload, so an
+    # unquoted value could round-trip with the wrong type. JSON string
+    # escaping is valid YAML double-quoted style.
+    return json.dumps(str(value))
+
+
+def _emit_config(config: Dict[str, Any]) -> Optional[str]:
+    """
+    Emit the config as YAML directly, skipping PyYAML's event pipeline.
+
+    The settings schema is a closed two-level mapping of scalars, so a
+    direct walk is enough. Returns None when the config doesn't fit that
+    shape; the caller then falls back to yaml.dump.
+    """
+    lines = []
+    for group, values in config.items():
+        if not isinstance(values, dict):
+            return None
+        lines.append(f'{group}:')
+        for key, value in values.items():
+            if isinstance(value, (dict, list, tuple)):
+                return None
+            lines.append(f'  {key}: {_format_scalar(value)}')
+    lines.append('')
+    return '\n'.join(lines)
 
 
 def get_config_path() -> Path:
@@ -20,8 +69,8 @@ def get_config_path() -> Path:
 
 def get_platform_kindle_path() -> str:
     """Get the default Kindle clippings path for the current platform."""
-    system = platform.system()
-    
+    system = _SYSTEM
+
     if system == "Darwin":  # macOS
         return "/Volumes/Kindle/documents/My Clippings.txt"
     elif system == "Windows":
@@ -39,7 +88,7 @@ def get_platform_kindle_path() -> str:
 
 def get_platform_output_path() -> str:
     """Get a sensible default output path for the current platform."""
-    system = platform.system()
+    system = _SYSTEM
     home = Path.home()
     
     if system == "Darwin":  # macOS
@@ -75,16 +124,26 @@ def get_default_config() -> Dict[str, Any]:
 def deep_merge(base: Dict, override: Dict) -> Dict:
     """Deep merge two dictionaries. Override takes precedence."""
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Iterative walk with an explicit stack: subtrees are only copied
+    # when the override actually reaches into them
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            existing = target.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                existing = target[key] = existing.copy()
+                stack.append((existing, value))
+            else:
+                target[key] = value
     return result
 
 
+@functools.lru_cache(maxsize=64)
 def expand_path(path: str) -> str:
     """Expand ~ and environment variables in path."""
+    # Pure string work on a handful of distinct configured paths; the
+    # UI re-expands the same values on every preview refresh and sync
     return os.path.expandvars(os.path.expanduser(path))
 
 
@@ -107,13 +166,20 @@ class Settings:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or get_config_path()
         self._config: Dict[str, Any] = get_default_config()
+        # Set by set(), cleared by save(); lets the UI batch many edits
+        # into one periodic disk write via save_if_dirty()
+        self._dirty = False
+        # Preview results memoized on a stat key, so repeated UI
+        # refreshes against unchanged paths skip the file scans
+        self._preview_cache: Dict[str, tuple] = {}
     
     def load(self) -> 'Settings':
         """Load settings from YAML file, merging with defaults."""
         if self.config_path.exists():
+            yaml, loader, _ = _yaml()
             try:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml.load(f, Loader=loader) or {}
                 self._config = deep_merge(get_default_config(), user_config)
             except Exception as e:
                 print(f"Warning: Could not load config: {e}")
@@ -122,11 +188,20 @@ class Settings:
     
     def save(self) -> None:
         """Save current settings to YAML file."""
+        self._dirty = False
+
         # Ensure parent directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        # Fast path: emit the known schema directly in one write
+        text = _emit_config(self._config)
+
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self._config, f, default_flow_style=False, sort_keys=False)
+            if text is not None:
+                f.write(text)
+            else:
+                yaml, _, dumper = _yaml()
+                yaml.dump(self._config, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
     
     def get(self, *keys: str, default: Any = None) -> Any:
         """
@@ -165,7 +240,13 @@ class Settings:
         
         # Set value
         current[keys[-1]] = value
+        self._dirty = True
     
+    def save_if_dirty(self) -> None:
+        """Save only when something changed since the last save."""
+        if self._dirty:
+            self.save()
+
     def get_expanded_path(self, *keys: str) -> str:
         """Get a path value with ~ and env vars expanded."""
         path = self.get(*keys, default='')
@@ -187,26 +268,37 @@ class Settings:
             return configured
         
         # Try platform-specific detection
-        system = platform.system()
-        
+        system = _SYSTEM
+
         if system == "Darwin":  # macOS
             path = "/Volumes/Kindle/documents/My Clippings.txt"
             if os.path.isfile(path):
                 return path
         elif system == "Windows":
             for drive in ["D", "E", "F", "G", "H"]:
+                # Probe the drive root first: absent drives fail there
+                # cheaply instead of on the deeper clippings path
+                if not os.path.exists(f"{drive}:\\"):
+                    continue
                 path = f"{drive}:\\documents\\My Clippings.txt"
                 if os.path.isfile(path):
                     return path
         else:  # Linux
-            # Try common mount points
+            # Try common mount points. scandir's cached entry type
+            # filters out non-directories without a stat per entry.
             for base in ["/media", "/mnt", "/run/media"]:
-                if os.path.isdir(base):
-                    for user_dir in os.listdir(base):
-                        path = os.path.join(base, user_dir, "Kindle", "documents", "My Clippings.txt")
+                try:
+                    entries = os.scandir(base)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+                        path = os.path.join(entry.path, "Kindle", "documents", "My Clippings.txt")
                         if os.path.isfile(path):
                             return path
-        
+
         return None
     
     def get_output_preview(self) -> Dict[str, int]:
@@ -214,28 +306,61 @@ class Settings:
         Get a preview of what's in the output directory.
         Returns dict with 'book_files' and 'total_highlights' counts.
         """
+        import mmap
         import re
-        
+
         output_dir = self.get_expanded_path('paths', 'output_directory')
         result = {'book_files': 0, 'total_highlights': 0}
-        
+
         if not os.path.isdir(output_dir):
             return result
-        
-        hash_pattern = re.compile(r'<a href="kindle:([a-f0-9]{8})"></a>')
-        
-        for filename in os.listdir(output_dir):
-            if filename.endswith('.md'):
+
+        # Keyed on the directory mtime; file rewrites that don't touch
+        # the directory are covered by invalidate_output_preview
+        try:
+            key = (output_dir, os.stat(output_dir).st_mtime_ns)
+        except OSError:
+            key = None
+        if key is not None:
+            cached = self._preview_cache.get('output')
+            if cached and cached[0] == key:
+                return cached[1]
+
+        # Bytes pattern over an mmap: the anchors are pure ASCII, so the
+        # count needs no UTF-8 decode or full-file string allocation
+        hash_pattern = re.compile(rb'<a href="kindle:([a-f0-9]{8})"></a>')
+        marker = b'<a href="kindle:'
+
+        # scandir batches name and file-type info, unlike listdir + stat
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.md') or not entry.is_file():
+                    continue
                 result['book_files'] += 1
                 try:
-                    filepath = os.path.join(output_dir, filename)
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    result['total_highlights'] += len(hash_pattern.findall(content))
+                    with open(entry.path, 'rb') as f:
+                        try:
+                            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                        except ValueError:
+                            continue  # empty file
+                        with mm:
+                            # Cheap find prefilter; only files that
+                            # actually contain the marker pay for the
+                            # regex, counted without a findall list
+                            if mm.find(marker) != -1:
+                                result['total_highlights'] += sum(
+                                    1 for _ in hash_pattern.finditer(mm)
+                                )
                 except:
                     pass
-        
+
+        if key is not None:
+            self._preview_cache['output'] = (key, result)
         return result
+
+    def invalidate_output_preview(self) -> None:
+        """Drop the cached output preview (e.g. after a sync wrote files)."""
+        self._preview_cache.pop('output', None)
     
     def get_clippings_preview(self) -> Dict[str, int]:
         """
@@ -243,39 +368,60 @@ class Settings:
         Returns dict with 'books' and 'highlights' counts.
         """
         result = {'books': 0, 'highlights': 0}
-        
+
         path = self.get_expanded_path('paths', 'kindle_clippings')
         if not os.path.isfile(path):
             return result
-        
+
+        # Unchanged files (same path, mtime, and size) are served from
+        # the cache, so every FocusOut doesn't re-scan a multi-MB file
         try:
-            with open(path, 'r', encoding='utf-8-sig') as f:
-                content = f.read()
-            
-            # Quick count without full parsing
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        if key is not None:
+            cached = self._preview_cache.get('clippings')
+            if cached and cached[0] == key:
+                return cached[1]
+
+        try:
+            # Quick single-pass count without loading the whole file
             boundary = "=========="
-            clippings = content.split(boundary)
-            
             books = set()
-            for clip in clippings:
-                clip = clip.strip()
-                if not clip:
-                    continue
-                
-                lines = clip.split('\n')
-                for line in lines:
-                    if line.strip():
+            highlights = 0
+            seen_title = False
+            counted = False
+
+            with open(path, 'r', encoding='utf-8-sig', buffering=1 << 20) as f:
+                for line in f:
+                    line = line.strip()
+                    if line == boundary:
+                        # Clip boundary: reset per-clip state
+                        seen_title = False
+                        counted = False
+                        continue
+                    if not line:
+                        continue
+
+                    if not seen_title:
                         # First non-empty line is the title
-                        books.add(line.strip())
-                        break
-                
-                # Check if it's a highlight or note (not bookmark)
-                if '- Your Highlight' in clip or '- Your Note' in clip:
-                    result['highlights'] += 1
-            
+                        books.add(line)
+                        seen_title = True
+
+                    # Check if it's a highlight or note (not bookmark);
+                    # the info line starts with the marker, so an anchored
+                    # prefix check beats two full-line substring scans
+                    if not counted and line.startswith(('- Your Highlight', '- Your Note')):
+                        highlights += 1
+                        counted = True
+
             result['books'] = len(books)
+            result['highlights'] = highlights
+            if key is not None:
+                self._preview_cache['clippings'] = (key, result)
         except:
             pass
-        
+
         return result
 
@@ -4,112 +4,288 @@ Clippings file parser for Kindle to Obsidian.
 Parses My Clippings.txt and returns structured data.
 """
 
+import bisect
 import hashlib
+import mmap
 import re
+import sys
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-from dateutil.parser import parse as parse_date
+# Optional: numba JIT for the note-linking sweep on very large books.
+# Purely opportunistic — everything works without it.
+try:
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def _link_bounds(h_starts, h_ends, n_starts):
+        """For each highlight range, find the [lo, hi) slice of sorted note starts."""
+        count = h_starts.shape[0]
+        total = n_starts.shape[0]
+        lo = np.empty(count, np.int64)
+        hi = np.empty(count, np.int64)
+        for i in range(count):
+            lo[i] = np.searchsorted(n_starts, h_starts[i])
+            j = lo[i]
+            while j < total and n_starts[j] <= h_ends[i]:
+                j += 1
+            hi[i] = j
+        return lo, hi
+
+except ImportError:
+    _link_bounds = None
 
 # Clipping boundary marker
 BOUNDARY = "=========="
+BOUNDARY_BYTES = b"=========="
 
-# Regex patterns
-REGEX_TITLE_AUTHOR = re.compile(r'^(.+)\s*\(([^)]+)\)\s*$')
-REGEX_INFO = re.compile(
-    r'^- Your (Highlight|Note|Bookmark).*?(?:on page (\d+))?\s*\|?\s*'
-    r'(?:Location (\d+(?:-\d+)?))?\s*\|\s*Added on (.+)$'
+# Kindle's "Added on" timestamps come in a couple of fixed formats
+# (US-style 12-hour and international 24-hour)
+KINDLE_DATE_FORMATS = (
+    "%A, %B %d, %Y %I:%M:%S %p",
+    "%A, %d %B %Y %H:%M:%S",
 )
-REGEX_LOCATION_RANGE = re.compile(r'(\d+)-(\d+)')
-REGEX_LOCATION_SINGLE = re.compile(r'(\d+)')
-REGEX_KINDLE_HASH = re.compile(r'<a href="kindle:([a-f0-9]{8})"></a>')
+
+# Index of the format that last succeeded; a file uses one format
+# throughout, so trying it first makes the others effectively free
+_last_date_format = 0
+
+# Literal markers in the record info line, with lengths precomputed so
+# the parse loop does no per-record len() calls
+INFO_PREFIX = '- Your '
+INFO_PREFIX_LEN = len(INFO_PREFIX)
+PAGE_MARKER = 'on page '
+PAGE_MARKER_LEN = len(PAGE_MARKER)
+LOCATION_MARKER = 'Location '
+LOCATION_MARKER_LEN = len(LOCATION_MARKER)
+DATE_MARKER = 'Added on '
+DATE_MARKER_LEN = len(DATE_MARKER)
+
+# Optional: xxh3 hashes short strings several times faster than any
+# cryptographic hash; 32 bits of a fast hash is all the IDs need
+try:
+    from xxhash import xxh3_64_hexdigest as _xxh3_hexdigest
+except ImportError:
+    _xxh3_hexdigest = None
+
+# Prefer google-re2 for text patterns when installed: linear-time DFA
+# matching with no catastrophic-backtracking risk. Optional, like numba.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# Regex patterns. The info line is rigid and pipe-separated, so it's
+# parsed with plain string methods; regex is kept only where parenthesis
+# ambiguity warrants backtracking (title/author) and for locations.
+REGEX_TITLE_AUTHOR = _re.compile(r'^(.+)\s*\(([^)]+)\)\s*$')
+REGEX_LOCATION_RANGE = _re.compile(r'(\d+)-(\d+)')
+REGEX_LOCATION_SINGLE = _re.compile(r'(\d+)')
+REGEX_KINDLE_HASH = re.compile(rb'<a href="kindle:([a-f0-9]{8})"></a>')
+KINDLE_HASH_MARKER = b'<a href="kindle:'
+
+# Sidecar file in the output directory caching per-file hash scans
+HASH_CACHE_FILENAME = '.hash_cache.json'
+
+# Minimum cache-miss files before a thread-pool scan pays for itself
+PARALLEL_SCAN_MIN_FILES = 16
+
+
+@dataclass(slots=True)
+class Clipping:
+    """One parsed highlight or note, packed into slots instead of a dict."""
+    type: str
+    content: str
+    hash: str
+    page: Optional[int] = None
+    loc_start: Optional[int] = None
+    loc_end: Optional[int] = None
+    date: Optional[datetime] = None
+    notes: List['Clipping'] = field(default_factory=list)
 
 
 def generate_hash(content: str) -> str:
     """Generate an 8-character hash for content."""
-    return hashlib.sha256(content.strip().encode('utf-8')).hexdigest()[:8]
+    data = content.strip().encode('utf-8')
+    if _xxh3_hexdigest is not None:
+        return _xxh3_hexdigest(data)[:8]
+    # blake2b is ~3x faster than SHA-256 and designed for short digests
+    return hashlib.blake2b(data, digest_size=4).hexdigest()
+
+
+def generate_fallback_hashes(content: str) -> List[str]:
+    """
+    Generate the hashes older schemes would have produced for content.
+
+    Checked alongside generate_hash so highlights exported by previous
+    versions (truncated SHA-256, or blake2b when xxhash wasn't
+    installed) are still recognized as already synced.
+    """
+    data = content.strip().encode('utf-8')
+    fallbacks = []
+    if _xxh3_hexdigest is not None:
+        fallbacks.append(hashlib.blake2b(data, digest_size=4).hexdigest())
+    fallbacks.append(hashlib.sha256(data).hexdigest()[:8])
+    return fallbacks
+
+
+def iter_raw_clippings(mm: mmap.mmap):
+    """
+    Yield decoded clipping records from a memory-mapped clippings file.
+
+    Splits on the bytes boundary so only one record is decoded at a time,
+    letting the OS page in the file lazily instead of reading it all upfront.
+    """
+    pos = 0
+    size = len(mm)
+    # Only the first record can carry a BOM, so only it pays for the
+    # utf-8-sig signature check; every later chunk decodes as plain utf-8
+    encoding = 'utf-8-sig'
+    while pos < size:
+        end = mm.find(BOUNDARY_BYTES, pos)
+        if end == -1:
+            end = size
+        chunk = mm[pos:end]
+        if chunk.strip():
+            # mmap bypasses text-mode universal newlines; normalize so
+            # CRLF files (the Kindle default) produce the same content
+            # and hashes as the old text-mode reader
+            yield chunk.decode(encoding).replace('\r\n', '\n')
+        encoding = 'utf-8'
+        pos = end + len(BOUNDARY_BYTES)
+
+
+# Parse results memoized on (realpath, mtime_ns, size); two entries is
+# enough for the input file plus one alternate (e.g. a -i override)
+_PARSE_CACHE: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+_PARSE_CACHE_MAX = 2
 
 
 def parse_clippings(filepath: str) -> Dict[str, Dict[str, Any]]:
     """
     Parse My Clippings.txt and return structured data.
-    
+
+    Unchanged files (same realpath, mtime, and size) are served from an
+    in-process cache, so re-running a sync skips the parse entirely.
+
     Args:
         filepath: Path to My Clippings.txt
-        
+
     Returns:
-        dict: {book_key: {'title': str, 'author': str, 'clippings': [...]}}
+        dict: {book_key: {'title': str, 'author': str, 'clippings': [...],
+               'highlight_count': int}}
     """
-    with open(filepath, 'r', encoding='utf-8-sig') as f:
-        content = f.read()
-    
-    # Remove BOM if present
-    content = content.replace('\ufeff', '')
-    
-    # Split by boundary
-    raw_clippings = content.split(BOUNDARY)
-    
-    books: Dict[str, Dict[str, Any]] = defaultdict(
-        lambda: {'title': '', 'author': '', 'clippings': []}
-    )
-    
+    import copy
+    import os
+
+    try:
+        stat = os.stat(filepath)
+        key = (os.path.realpath(filepath), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = None
+
+    if key is not None:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            # Deep-copy out of the cache: callers mutate the clippings
+            _PARSE_CACHE[key] = _PARSE_CACHE.pop(key)  # mark most recent
+            return copy.deepcopy(cached)
+
+    books = _parse_file(filepath)
+
+    if key is not None:
+        while len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+        _PARSE_CACHE[key] = copy.deepcopy(books)
+
+    return books
+
+
+def _parse_file(filepath: str) -> Dict[str, Dict[str, Any]]:
+    """Parse the clippings file from disk, bypassing the memo cache."""
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return {}
+
+        with mm:
+            return _parse_records(iter_raw_clippings(mm))
+
+
+def _parse_records(raw_clippings) -> Dict[str, Dict[str, Any]]:
+    """Build the books dict from an iterable of raw clipping records."""
+    books: Dict[str, Dict[str, Any]] = {}
+
     for raw in raw_clippings:
         raw = raw.strip()
         if not raw:
             continue
-        
-        lines = raw.split('\n')
-        
-        # Find title line (first non-empty line)
-        title_line: Optional[str] = None
-        title_idx = 0
-        for i, line in enumerate(lines):
-            if line.strip():
-                title_line = line.strip()
-                title_idx = i
-                break
-        
-        if title_line is None:
+
+        # Split the record into title line, info line, and body
+        title_line, _, rest = raw.partition('\n')
+        info_line, _, body = rest.lstrip().partition('\n')
+        info_line = info_line.strip()
+
+        if not info_line.startswith(INFO_PREFIX):
             continue
-        
-        # Find info line (next non-empty line after title)
-        info_line: Optional[str] = None
-        info_idx = 0
-        for i, line in enumerate(lines[title_idx + 1:], start=title_idx + 1):
-            if line.strip():
-                info_line = line.strip()
-                info_idx = i
-                break
-        
-        if info_line is None:
+
+        type_word, _, meta = info_line[INFO_PREFIX_LEN:].partition(' ')
+        clip_type = type_word.lower()  # highlight, note, bookmark
+
+        # Skip bookmarks
+        if clip_type == 'bookmark':
             continue
-        
+        if clip_type not in ('highlight', 'note'):
+            continue
+
+        # Parse the pipe-separated metadata with plain string methods
+        page: Optional[str] = None
+        location: Optional[str] = None
+        date_str: Optional[str] = None
+        for part in meta.split('|'):
+            part = part.strip()
+            if part.startswith(PAGE_MARKER):
+                page = part[PAGE_MARKER_LEN:].strip()
+            elif part.startswith(LOCATION_MARKER):
+                location = part[LOCATION_MARKER_LEN:].strip()
+            elif part.startswith(DATE_MARKER):
+                date_str = part[DATE_MARKER_LEN:].strip()
+
+        if not date_str:
+            continue
+
+        # Check content before doing any per-clipping parsing work, so
+        # empty and DRM-limited records cost nothing beyond the header
+        content_text = body.strip()
+
+        if not content_text:
+            continue
+
+        # Skip Kindle DRM limit messages
+        if 'You have reached the clipping limit for this item' in content_text:
+            continue
+
+        # Page ranges and non-numeric pages: keep the leading number only
+        if page is not None and not page.isdigit():
+            page = page.split('-', 1)[0]
+            if not page.isdigit():
+                page = None
+
         # Parse title and author
-        title_match = REGEX_TITLE_AUTHOR.match(title_line)
-        
+        title_match = REGEX_TITLE_AUTHOR.match(title_line.strip())
+
         if title_match:
             title = title_match.group(1).strip()
             author = title_match.group(2).strip()
         else:
             title = title_line.strip()
             author = "Unknown"
-        
-        # Parse info line (type, location, page, date)
-        info_match = REGEX_INFO.match(info_line)
-        
-        if not info_match:
-            continue
-        
-        clip_type = info_match.group(1).lower()  # highlight, note, bookmark
-        page = info_match.group(2)
-        location = info_match.group(3)
-        date_str = info_match.group(4)
-        
-        # Skip bookmarks
-        if clip_type == 'bookmark':
-            continue
-        
+
         # Parse location
         loc_start: Optional[int] = None
         loc_end: Optional[int] = None
@@ -124,66 +300,71 @@ def parse_clippings(filepath: str) -> Dict[str, Dict[str, Any]]:
                     loc_start = int(single_match.group(1))
                     loc_end = loc_start
         
-        # Parse date
+        # Parse date: fixed strptime formats first (most recently
+        # successful one leading), generic dateutil as last resort
+        global _last_date_format
         parsed_date: Optional[datetime] = None
-        try:
-            parsed_date = parse_date(date_str)
-        except:
-            pass
-        
-        # Get content (everything after info line, preserving newlines)
-        content_lines = lines[info_idx + 1:]
-        # Strip leading/trailing empty lines but preserve internal newlines
-        while content_lines and not content_lines[0].strip():
-            content_lines.pop(0)
-        while content_lines and not content_lines[-1].strip():
-            content_lines.pop()
-        content_text = '\n'.join(content_lines)
-        
-        if not content_text:
-            continue
-        
-        # Skip Kindle DRM limit messages
-        if 'You have reached the clipping limit for this item' in content_text:
-            continue
+        for offset in range(len(KINDLE_DATE_FORMATS)):
+            index = (_last_date_format + offset) % len(KINDLE_DATE_FORMATS)
+            try:
+                parsed_date = datetime.strptime(date_str, KINDLE_DATE_FORMATS[index])
+                _last_date_format = index
+                break
+            except ValueError:
+                continue
+        if parsed_date is None:
+            # dateutil is imported lazily; the fallback is rarely taken
+            try:
+                from dateutil.parser import parse as parse_date
+                parsed_date = parse_date(date_str)
+            except:
+                pass
         
         # Generate hash
         content_hash = generate_hash(content_text)
         
         # Create clipping object
-        clipping = {
-            'type': clip_type,
-            'content': content_text,
-            'hash': content_hash,
-            'page': int(page) if page else None,
-            'loc_start': loc_start,
-            'loc_end': loc_end,
-            'date': parsed_date,
-        }
+        clipping = Clipping(
+            type=clip_type,
+            content=content_text,
+            hash=content_hash,
+            page=int(page) if page else None,
+            loc_start=loc_start,
+            loc_end=loc_end,
+            date=parsed_date,
+        )
         
-        # Use title as key
-        book_key = title
-        books[book_key]['title'] = title
-        books[book_key]['author'] = author
-        books[book_key]['clippings'].append(clipping)
-    
-    return dict(books)
+        # Use the interned title as key so repeat lookups compare by pointer
+        book_key = sys.intern(title)
+        book = books.get(book_key)
+        if book is None:
+            book = books[book_key] = {
+                'title': title,
+                'author': author,
+                'clippings': [],
+                'highlight_count': 0,
+            }
+        book['clippings'].append(clipping)
+        if clip_type == 'highlight':
+            book['highlight_count'] += 1
 
+    return books
 
-def deduplicate_partial_notes(notes: List[Dict]) -> List[Dict]:
+
+def deduplicate_partial_notes(notes: List[Clipping]) -> List[Clipping]:
     """
     Remove partial notes that are prefixes of longer notes at the same location.
-    
+
     Kindle sometimes saves incremental versions of notes as you type.
     This keeps only the longest/final version.
     """
     if not notes:
         return notes
-    
+
     # Group notes by location
-    by_location: Dict[tuple, List[Dict]] = defaultdict(list)
+    by_location: Dict[tuple, List[Clipping]] = defaultdict(list)
     for note in notes:
-        loc_key = (note['loc_start'], note['loc_end'])
+        loc_key = (note.loc_start, note.loc_end)
         by_location[loc_key].append(note)
     
     result = []
@@ -193,101 +374,204 @@ def deduplicate_partial_notes(notes: List[Dict]) -> List[Dict]:
             continue
         
         # Sort by content length (longest first)
-        loc_notes.sort(key=lambda x: len(x['content']), reverse=True)
-        
-        # Keep only notes that aren't prefixes of longer notes
+        loc_notes.sort(key=lambda x: len(x.content), reverse=True)
+
+        # Insert longest-first into a character trie: a note whose whole
+        # content walks existing nodes is a prefix of an already-kept
+        # note. Linear in total characters instead of quadratic in note
+        # count, with no special case for small groups.
         kept = []
+        trie: Dict[str, Any] = {}
         for note in loc_notes:
-            is_prefix = False
-            for longer_note in kept:
-                if longer_note['content'].startswith(note['content']):
-                    is_prefix = True
-                    break
+            node = trie
+            is_prefix = True
+            for char in note.content:
+                child = node.get(char)
+                if child is None:
+                    child = node[char] = {}
+                    is_prefix = False
+                node = child
             if not is_prefix:
                 kept.append(note)
-        
+
         result.extend(kept)
     
     return result
 
 
-def link_notes_to_highlights(clippings: List[Dict]) -> List[Dict]:
+def link_notes_to_highlights(clippings: List[Clipping]) -> List[Clipping]:
     """
     Link notes to their corresponding highlights based on location.
-    
+
     Returns clippings sorted by location with notes nested under highlights.
     """
-    highlights = [c for c in clippings if c['type'] == 'highlight']
-    notes = [c for c in clippings if c['type'] == 'note']
-    
+    highlights = [c for c in clippings if c.type == 'highlight']
+    notes = [c for c in clippings if c.type == 'note']
+
     # Deduplicate partial notes first
     notes = deduplicate_partial_notes(notes)
-    
+
     # Sort highlights by location
-    highlights.sort(key=lambda x: (x['loc_start'] or 0, x['date'] or datetime.min))
-    
+    highlights.sort(key=lambda x: (x.loc_start or 0, x.date or datetime.min))
+
+    # Sort located notes once so each highlight can bisect into them
+    # instead of scanning every note (O((H+N) log N) vs O(H*N))
+    located_notes = [n for n in notes if n.loc_start is not None]
+    located_notes.sort(key=lambda n: n.loc_start)
+    note_starts = [n.loc_start for n in located_notes]
+
     # Link notes to highlights
-    for highlight in highlights:
-        highlight['notes'] = []
-        
-        if highlight['loc_start'] is None:
-            continue
-        
-        for note in notes:
-            if note['loc_start'] is None:
+    if _link_bounds is not None and located_notes and len(highlights) * len(located_notes) >= 65536:
+        # JIT-compiled sweep for very large books (empty range for no location)
+        h_starts = np.array(
+            [h.loc_start if h.loc_start is not None else -1 for h in highlights],
+            dtype=np.int64
+        )
+        h_ends = np.array(
+            [(h.loc_end or h.loc_start) if h.loc_start is not None else -2
+             for h in highlights],
+            dtype=np.int64
+        )
+        lo, hi = _link_bounds(h_starts, h_ends, np.array(note_starts, dtype=np.int64))
+        for i, highlight in enumerate(highlights):
+            highlight.notes = located_notes[lo[i]:hi[i]]
+    else:
+        for highlight in highlights:
+            if highlight.loc_start is None:
+                highlight.notes = []
                 continue
-            
-            # Check if note location falls within highlight range
-            loc_end = highlight['loc_end'] or highlight['loc_start']
-            if highlight['loc_start'] <= note['loc_start'] <= loc_end:
-                highlight['notes'].append(note)
-    
-    # Find unlinked notes (notes that didn't match any highlight)
-    linked_note_hashes = set()
-    for h in highlights:
-        for n in h['notes']:
-            linked_note_hashes.add(n['hash'])
-    
-    unlinked_notes = [n for n in notes if n['hash'] not in linked_note_hashes]
-    
+
+            # Slice out notes whose location falls within the highlight
+            # range: O(log N) per highlight, no Python-level walk
+            lo = bisect.bisect_left(note_starts, highlight.loc_start)
+            hi = bisect.bisect_right(note_starts, highlight.loc_end or highlight.loc_start)
+            highlight.notes = located_notes[lo:hi]
+
+    # Find unlinked notes (notes that didn't match any highlight).
+    # Track by object identity so membership tests stay pointer-sized
+    # instead of hashing content strings.
+    linked_note_ids = {id(n) for h in highlights for n in h.notes}
+
+    unlinked_notes = [n for n in notes if id(n) not in linked_note_ids]
+
     # Add unlinked notes as standalone items
     result = highlights + unlinked_notes
-    result.sort(key=lambda x: (x['loc_start'] or 0, x['date'] or datetime.min))
+    result.sort(key=lambda x: (x.loc_start or 0, x.date or datetime.min))
     
     return result
 
 
-def scan_existing_hashes(output_dir: str) -> Dict[str, str]:
+def scan_existing_hashes(output_dir: str, write_cache: bool = True) -> Set[str]:
     """
     Scan existing markdown files for kindle hash comments.
-    
+
     Args:
         output_dir: Path to the output directory
-        
+        write_cache: If False, don't refresh the sidecar cache file
+            (dry runs must not create files in the vault)
+
     Returns:
-        dict: {hash: filename} mapping
+        set: hashes already present in the vault
     """
+    import json
     import os
-    
-    existing_hashes: Dict[str, str] = {}
-    
+
+    existing_hashes: Set[str] = set()
+
     if not os.path.isdir(output_dir):
         return existing_hashes
-    
-    for filename in os.listdir(output_dir):
-        if not filename.endswith('.md'):
-            continue
-        
-        filepath = os.path.join(output_dir, filename)
+
+    # Sidecar cache keyed on (mtime_ns, size): unchanged files are
+    # served from it without being re-read
+    cache_path = os.path.join(output_dir, HASH_CACHE_FILENAME)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except Exception:
+        cache = {}
+
+    new_cache: Dict[str, Dict[str, Any]] = {}
+
+    # scandir fetches name and file type in one syscall; mmap lets the
+    # bytes regex scan each file without an intermediate read/decode copy
+    to_scan = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.md') or not entry.is_file():
+                continue
+
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            cached = cache.get(entry.name)
+            if (
+                cached
+                and cached.get('mtime_ns') == stat.st_mtime_ns
+                and cached.get('size') == stat.st_size
+            ):
+                hashes = cached['hashes']
+            else:
+                to_scan.append(entry)
+                hashes = None
+
+            new_cache[entry.name] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'hashes': hashes,
+            }
+
+    # Scanning is I/O-bound and each file is independent; overlap the
+    # reads with a thread pool once there are enough cache misses for
+    # the pool to pay for itself
+    if len(to_scan) >= PARALLEL_SCAN_MIN_FILES:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, len(to_scan))) as executor:
+            scanned = executor.map(_scan_file_hashes, to_scan)
+    else:
+        scanned = map(_scan_file_hashes, to_scan)
+
+    for entry, hashes in zip(to_scan, scanned):
+        new_cache[entry.name]['hashes'] = hashes
+
+    for cached in new_cache.values():
+        existing_hashes.update(cached['hashes'])
+
+    # Refresh the cache in one write; a read-only vault just skips it
+    if write_cache:
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            hashes = REGEX_KINDLE_HASH.findall(content)
-            for h in hashes:
-                existing_hashes[h] = filename
-        except Exception as e:
-            print(f"Warning: Could not read {filename}: {e}")
-    
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(new_cache, f)
+        except OSError:
+            pass
+
     return existing_hashes
 
+
+def _scan_file_hashes(entry) -> List[str]:
+    """Scan one markdown file and return its kindle hashes in order."""
+    hashes: List[str] = []
+    try:
+        with open(entry.path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return hashes  # empty file
+            with mm:
+                # Jump between marker occurrences with bytes find
+                # (memchr-fast) so the regex only runs at candidates
+                pos = mm.find(KINDLE_HASH_MARKER)
+                while pos != -1:
+                    match = REGEX_KINDLE_HASH.match(mm, pos)
+                    if match:
+                        hashes.append(match.group(1).decode('ascii'))
+                        pos = match.end()
+                    else:
+                        pos += len(KINDLE_HASH_MARKER)
+                    pos = mm.find(KINDLE_HASH_MARKER, pos)
+    except Exception as e:
+        print(f"Warning: Could not read {entry.name}: {e}")
+    return hashes
+
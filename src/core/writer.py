@@ -4,22 +4,95 @@ Markdown file writer for Kindle to Obsidian.
 Writes highlights and notes to Obsidian-compatible markdown files.
 """
 
+import functools
 import os
-import re
 import unicodedata
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from .parser import link_notes_to_highlights
+from .parser import Clipping, generate_fallback_hashes, link_notes_to_highlights
 
 
+def _no_log(_msg: str) -> None:
+    """Default log sink when no callback is supplied."""
+
+
+def is_already_exported(clipping: Clipping, existing_hashes: Set[str]) -> bool:
+    """
+    Check whether a clipping was already written to the vault.
+
+    Falls back to the hashes older versions would have written so
+    previously exported files aren't re-imported as duplicates.
+    """
+    if not existing_hashes:
+        # Fresh vault: nothing can be a duplicate, skip the fallback
+        # hashing entirely
+        return False
+    if clipping.hash in existing_hashes:
+        return True
+    return any(h in existing_hashes for h in generate_fallback_hashes(clipping.content))
+
+
+def _linked_clippings(book_data: Dict[str, Any]) -> List[Clipping]:
+    """
+    Link a book's notes to highlights, at most once per book dict.
+
+    The linked result replaces the raw clippings in place and is marked
+    with a sentinel key, so a book that passes through the writer more
+    than once (e.g. a dry run followed by a real sync) isn't re-linked.
+    """
+    if not book_data.get('_linked'):
+        book_data['clippings'] = link_notes_to_highlights(book_data['clippings'])
+        book_data['_linked'] = True
+    return book_data['clippings']
+
+
+def write_markdown_lines(filepath: str, lines: List[str], append: bool = False) -> None:
+    """
+    Write pre-built markdown lines to a file in one batched operation.
+
+    Writes through a raw file descriptor — no buffered-IO layer to
+    construct or flush. On POSIX the per-line segments go straight to
+    os.writev; elsewhere they are joined into one os.write. When
+    appending, a separator newline is written first.
+    """
+    segments: List[bytes] = []
+    if append:
+        segments.append(b'\n')
+    last = len(lines) - 1
+    for i, line in enumerate(lines):
+        segments.append((line + '\n' if i != last else line).encode('utf-8'))
+
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    flags |= getattr(os, 'O_BINARY', 0)  # Windows
+    fd = os.open(filepath, flags, 0o644)
+    try:
+        if hasattr(os, 'writev'):
+            # writev is capped at IOV_MAX segments per call
+            for start in range(0, len(segments), 512):
+                os.writev(fd, segments[start:start + 512])
+        else:
+            os.write(fd, b''.join(segments))
+    finally:
+        os.close(fd)
+
+
+# Invalid filename characters plus control characters, deleted in one
+# str.translate pass instead of two regex substitutions
+INVALID_FILENAME_CHARS = str.maketrans('', '', (
+    '<>:"/\\|?*'
+    + ''.join(chr(c) for c in range(0x20))
+    + ''.join(chr(c) for c in range(0x7f, 0xa0))
+))
+
+
+@functools.lru_cache(maxsize=2048)
 def sanitize_filename(filename: str, max_length: int = 128) -> str:
     """Create a safe filename from a book title."""
-    # Normalize unicode characters
-    clean = unicodedata.normalize('NFKD', filename)
-    # Remove or replace invalid characters
-    clean = re.sub(r'[<>:"/\\|?*]', '', clean)
-    # Remove control characters
-    clean = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', clean)
+    # Normalize unicode (ASCII titles skip NFKD entirely — isascii is a
+    # C-level flag check), then drop invalid and control characters
+    clean = filename if filename.isascii() else unicodedata.normalize('NFKD', filename)
+    clean = clean.translate(INVALID_FILENAME_CHARS)
     # Strip whitespace and dots from ends
     clean = clean.strip().strip('.')
     # Truncate if too long
@@ -28,97 +101,110 @@ def sanitize_filename(filename: str, max_length: int = 128) -> str:
     return clean
 
 
+@functools.lru_cache(maxsize=8)
+def _frontmatter_template(include_author: bool, include_tags: bool, default_tag: str) -> str:
+    """
+    Build the book-file frontmatter block for one config shape.
+
+    The config is invariant for a whole sync, so the branching runs
+    once per shape (lru_cache) and each new file just substitutes the
+    author into the prebuilt template.
+    """
+    parts = ['---']
+    if include_author:
+        parts.append('author: "{author}"')
+    if include_tags:
+        parts.append('tags:\n  - ' + default_tag)
+    parts.append('---\n')
+    return '\n'.join(parts)
+
+
 def write_book_file(
     book_data: Dict[str, Any],
     output_dir: str,
-    existing_hashes: Dict[str, str],
+    existing_hashes: Set[str],
     config: Dict[str, Any],
     dry_run: bool = False,
-    log_callback: Optional[Callable[[str], None]] = None
+    log_callback: Optional[Callable[[str], None]] = None,
+    existing_files: Optional[Set[str]] = None
 ) -> Tuple[int, int, List[Dict]]:
     """
     Write or append to a book's markdown file.
-    
+
     Args:
         book_data: Book data with title, author, and clippings
         output_dir: Output directory path
-        existing_hashes: Dict of already-exported hashes
+        existing_hashes: Set of already-exported hashes
         config: Configuration dictionary
         dry_run: If True, don't write files
         log_callback: Optional callback for logging messages
-        
+        existing_files: Optional set of filenames already in output_dir,
+            used to skip the per-book stat call; updated in place when
+            a new file is created so later books that sanitize to the
+            same filename append instead of truncating it
+
     Returns:
         tuple: (new_count, total_count, new_clippings_list)
     """
-    def log(msg: str):
-        if log_callback:
-            log_callback(msg)
-    
+    log = log_callback or _no_log
+
     title = book_data['title']
     author = book_data['author']
-    clippings = link_notes_to_highlights(book_data['clippings'])
-    
-    # Filter to only new clippings
+    clippings = _linked_clippings(book_data)
+
+    # Filter and emit in a single pass over the clippings
     new_clippings = []
+    body_lines: List[str] = []
     for c in clippings:
-        if c['hash'] not in existing_hashes:
-            new_clippings.append(c)
-        # Also check nested notes
-        if 'notes' in c:
-            c['notes'] = [n for n in c['notes'] if n['hash'] not in existing_hashes]
-    
+        if is_already_exported(c, existing_hashes):
+            continue
+        new_clippings.append(c)
+
+        # Only new clippings are emitted, so only their notes need the
+        # duplicate filter
+        c.notes = [n for n in c.notes if not is_already_exported(n, existing_hashes)]
+
+        block = f'---\n<a href="kindle:{c.hash}"></a>\n{c.content}'
+        for note in c.notes:
+            block += f'\n<a href="kindle:{note.hash}"></a>\n> {note.content}'
+        body_lines.extend((block, ''))
+
     if not new_clippings:
         return 0, len(clippings), []
-    
+
     # Create filename
     filename = sanitize_filename(title) + '.md'
     filepath = os.path.join(output_dir, filename)
-    
-    # Check if file exists
-    file_exists = os.path.isfile(filepath)
-    
+
+    # Check if file exists; a pre-scanned name set replaces the stat
+    if existing_files is not None:
+        file_exists = filename in existing_files
+    else:
+        file_exists = os.path.isfile(filepath)
+
     # Build content to write
     lines = []
-    
+
     if not file_exists:
-        # Create new file with frontmatter
-        lines.append('---')
-        if config.get('frontmatter', {}).get('include_author', True):
-            lines.append(f'author: "{author}"')
-        if config.get('frontmatter', {}).get('include_tags', True):
-            lines.append('tags:')
-            default_tag = config.get('output', {}).get('default_tag', 'books')
-            lines.append(f'  - {default_tag}')
-        lines.append('---')
-        lines.append('')
-    
-    # Add clippings
-    for clipping in new_clippings:
-        lines.append('---')
-        lines.append(f'<a href="kindle:{clipping["hash"]}"></a>')
-        lines.append(clipping['content'])
-        
-        # Add nested notes
-        if 'notes' in clipping and clipping['notes']:
-            for note in clipping['notes']:
-                lines.append(f'<a href="kindle:{note["hash"]}"></a>')
-                lines.append(f'> {note["content"]}')
-        
-        lines.append('')
-    
+        # Create new file with frontmatter from the cached template
+        # (replace, not str.format, so authors with braces are safe)
+        frontmatter = config.get('frontmatter', {})
+        template = _frontmatter_template(
+            frontmatter.get('include_author', True),
+            frontmatter.get('include_tags', True),
+            config.get('output', {}).get('default_tag', 'books'),
+        )
+        lines.append(template.replace('{author}', author))
+
+    lines.extend(body_lines)
     lines.append('---')
     
     if not dry_run:
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Write to file
-        mode = 'a' if file_exists else 'w'
-        with open(filepath, mode, encoding='utf-8') as f:
-            if file_exists:
-                f.write('\n')  # Add separator if appending
-            f.write('\n'.join(lines))
-        
+        # Write to file (sync_highlights creates the output directory)
+        write_markdown_lines(filepath, lines, append=file_exists)
+        if existing_files is not None and not file_exists:
+            existing_files.add(filename)
+
         log(f"  {title}: {len(new_clippings)} new")
     
     return len(new_clippings), len(clippings), new_clippings
@@ -127,7 +213,7 @@ def write_book_file(
 def write_short_notes_file(
     short_books: List[Dict[str, Any]],
     output_dir: str,
-    existing_hashes: Dict[str, str],
+    existing_hashes: Set[str],
     config: Dict[str, Any],
     dry_run: bool = False,
     log_callback: Optional[Callable[[str], None]] = None
@@ -138,7 +224,7 @@ def write_short_notes_file(
     Args:
         short_books: List of book data dicts
         output_dir: Output directory path
-        existing_hashes: Dict of already-exported hashes
+        existing_hashes: Set of already-exported hashes
         config: Configuration dictionary
         dry_run: If True, don't write files
         log_callback: Optional callback for logging messages
@@ -146,10 +232,8 @@ def write_short_notes_file(
     Returns:
         tuple: (new_count, books_processed, list of {book_title, book_author, clippings})
     """
-    def log(msg: str):
-        if log_callback:
-            log_callback(msg)
-    
+    log = log_callback or _no_log
+
     filename = config.get('output', {}).get('short_notes_filename', 'Short Notes.md')
     filepath = os.path.join(output_dir, filename)
     file_exists = os.path.isfile(filepath)
@@ -163,82 +247,92 @@ def write_short_notes_file(
         # Create new file with frontmatter
         lines.append('---')
         if config.get('frontmatter', {}).get('include_tags', True):
-            lines.append('tags:')
-            default_tag = config.get('output', {}).get('default_tag', 'books')
-            short_tag = config.get('output', {}).get('short_notes_tag', 'short-notes')
-            lines.append(f'  - {default_tag}')
-            lines.append(f'  - {short_tag}')
-        lines.append('---')
-        lines.append('')
+            output_cfg = config.get('output', {})
+            default_tag = output_cfg.get('default_tag', 'books')
+            short_tag = output_cfg.get('short_notes_tag', 'short-notes')
+            lines.extend(('tags:', f'  - {default_tag}', f'  - {short_tag}'))
+        lines.extend(('---', ''))
     
     for book_data in short_books:
         title = book_data['title']
         author = book_data['author']
-        clippings = link_notes_to_highlights(book_data['clippings'])
-        
-        # Filter to only new clippings
+        clippings = _linked_clippings(book_data)
+
+        # Filter and emit in a single pass over the clippings
         new_clippings = []
+        body_lines: List[str] = []
         for c in clippings:
-            if c['hash'] not in existing_hashes:
-                new_clippings.append(c)
-            if 'notes' in c:
-                c['notes'] = [n for n in c['notes'] if n['hash'] not in existing_hashes]
-        
+            if is_already_exported(c, existing_hashes):
+                continue
+            new_clippings.append(c)
+
+            c.notes = [n for n in c.notes if not is_already_exported(n, existing_hashes)]
+
+            block = f'---\n<a href="kindle:{c.hash}"></a>\n{c.content}'
+            for note in c.notes:
+                block += f'\n<a href="kindle:{note.hash}"></a>\n> {note.content}'
+            body_lines.extend((block, ''))
+
         if not new_clippings:
             continue
-        
+
         books_with_new += 1
         total_new += len(new_clippings)
-        
+
         # Track for import log
         all_new_items.append({
             'book_title': title,
             'book_author': author,
             'clippings': new_clippings
         })
-        
-        # Add book section header
-        lines.append(f'## {title}')
-        lines.append(f'*{author}*')
-        lines.append('')
-        
-        # Add clippings
-        for clipping in new_clippings:
-            lines.append('---')
-            lines.append(f'<a href="kindle:{clipping["hash"]}"></a>')
-            lines.append(clipping['content'])
-            
-            # Add nested notes
-            if 'notes' in clipping and clipping['notes']:
-                for note in clipping['notes']:
-                    lines.append(f'<a href="kindle:{note["hash"]}"></a>')
-                    lines.append(f'> {note["content"]}')
-            
-            lines.append('')
-        
-        # Add closing divider for last book section
-        lines.append('---')
-        lines.append('')
+
+        # Add book section header, clippings, and closing divider
+        lines.extend((f'## {title}', f'*{author}*', ''))
+        lines.extend(body_lines)
+        lines.extend(('---', ''))
     
     if not lines or (file_exists and len(lines) == 0):
         return 0, 0, []
     
     if not dry_run:
-        # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Write to file
-        mode = 'a' if file_exists else 'w'
-        with open(filepath, mode, encoding='utf-8') as f:
-            if file_exists and lines:
-                f.write('\n')
-            f.write('\n'.join(lines))
-        
+        # Write to file (sync_highlights creates the output directory)
+        write_markdown_lines(filepath, lines, append=file_exists)
+
         log(f"  {filename}: {total_new} new from {books_with_new} books")
     
     return total_new, books_with_new, all_new_items
 
 
+# Minimum number of regular books before a process pool pays for itself
+PARALLEL_MIN_BOOKS = 8
+
+# Shared state for the per-book process pool, set once per worker by the
+# initializer so it isn't re-pickled for every task
+_pool_existing_hashes: Set[str] = set()
+_pool_config: Dict[str, Any] = {}
+_pool_existing_files: Optional[Set[str]] = None
+
+
+def _init_book_pool(
+    existing_hashes: Set[str],
+    config: Dict[str, Any],
+    existing_files: Optional[Set[str]] = None
+) -> None:
+    """Process-pool initializer: stash shared state in the worker."""
+    global _pool_existing_hashes, _pool_config, _pool_existing_files
+    _pool_existing_hashes = existing_hashes
+    _pool_config = config
+    _pool_existing_files = existing_files
+
+
+def _write_book_task(book_data: Dict[str, Any], output_dir: str, dry_run: bool):
+    """Process-pool task: write one book using the worker's shared state."""
+    return write_book_file(
+        book_data, output_dir, _pool_existing_hashes, _pool_config, dry_run,
+        existing_files=_pool_existing_files
+    )
+
+
 def write_import_log(
     new_items: List[Dict[str, Any]],
     output_dir: str,
@@ -264,10 +358,8 @@ def write_import_log(
     """
     from datetime import datetime
     
-    def log(msg: str):
-        if log_callback:
-            log_callback(msg)
-    
+    log = log_callback or _no_log
+
     # Skip if no new items
     total_new = sum(len(item['clippings']) for item in new_items)
     if total_new == 0:
@@ -277,17 +369,20 @@ def write_import_log(
     log_folder_name = config.get('output', {}).get('import_log_folder', 'Import Logs')
     log_dir = os.path.join(output_dir, log_folder_name)
     
+    # One snapshot of "now" for every timestamp in the log, so the
+    # filename, frontmatter, and heading can never straddle a second
+    now = datetime.now()
+
     # Create timestamped filename
-    timestamp = datetime.now().strftime('%Y-%m-%d %H-%M-%S')
-    filename = f"Import {timestamp}.md"
+    filename = f"Import {now.strftime('%Y-%m-%d %H-%M-%S')}.md"
     filepath = os.path.join(log_dir, filename)
-    
+
     # Build content
     lines = []
-    
+
     # Frontmatter
     lines.append('---')
-    lines.append(f'imported: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+    lines.append(f'imported: {now.strftime("%Y-%m-%d %H:%M:%S")}')
     lines.append(f'total_new: {total_new}')
     lines.append(f'books: {len(new_items)}')
     if config.get('frontmatter', {}).get('include_tags', True):
@@ -295,13 +390,14 @@ def write_import_log(
         lines.append('  - import-log')
     lines.append('---')
     lines.append('')
-    lines.append(f'# Import Log - {datetime.now().strftime("%B %d, %Y at %H:%M")}')
+    lines.append(f'# Import Log - {now.strftime("%B %d, %Y at %H:%M")}')
     lines.append('')
     lines.append(f'**{total_new} new highlights** from **{len(new_items)} books**')
     lines.append('')
     
-    # Add each book's new clippings
-    for item in sorted(new_items, key=lambda x: x['book_title']):
+    # Add each book's new clippings, sorted in place with a C-level key
+    new_items.sort(key=itemgetter('book_title'))
+    for item in new_items:
         title = item['book_title']
         author = item['book_author']
         clippings = item['clippings']
@@ -315,13 +411,12 @@ def write_import_log(
         
         for clipping in clippings:
             lines.append('---')
-            lines.append(clipping['content'])
-            
+            lines.append(clipping.content)
+
             # Add nested notes if present
-            if 'notes' in clipping and clipping['notes']:
-                for note in clipping['notes']:
-                    lines.append(f'> {note["content"]}')
-            
+            for note in clipping.notes:
+                lines.append(f'> {note.content}')
+
             lines.append('')
         
         lines.append('---')
@@ -361,10 +456,8 @@ def sync_highlights(
     """
     from .parser import parse_clippings, scan_existing_hashes
     
-    def log(msg: str):
-        if log_callback:
-            log_callback(msg)
-    
+    log = log_callback or _no_log
+
     # Parse clippings
     log("Parsing clippings file...")
     books = parse_clippings(input_path)
@@ -372,8 +465,13 @@ def sync_highlights(
     
     # Scan existing hashes
     log("Scanning existing files...")
-    existing_hashes = scan_existing_hashes(output_dir)
+    existing_hashes = scan_existing_hashes(output_dir, write_cache=not dry_run)
     log(f"Found {len(existing_hashes)} existing highlights")
+
+    # Create the output directory once up front; the per-book writers
+    # no longer stat the path components on every call
+    if not dry_run:
+        os.makedirs(output_dir, exist_ok=True)
     
     # Separate books by highlight count
     min_highlights = config.get('output', {}).get('min_highlights_for_own_file', 3)
@@ -381,7 +479,8 @@ def sync_highlights(
     short_books = []
     
     for book_key, book_data in books.items():
-        highlight_count = len([c for c in book_data['clippings'] if c['type'] == 'highlight'])
+        # Counted during parsing; no per-book pass over the clippings
+        highlight_count = book_data['highlight_count']
         if highlight_count >= min_highlights:
             regular_books[book_key] = book_data
         else:
@@ -398,12 +497,71 @@ def sync_highlights(
     total_new = 0
     if regular_books:
         log("Processing book files:")
-        for book_key, book_data in sorted(regular_books.items()):
-            new_count, total_count, new_clippings = write_book_file(
-                book_data, output_dir, existing_hashes, config, dry_run, log_callback
+        items = sorted(regular_books.items())
+
+        # One directory read replaces a stat per book when deciding
+        # whether each file needs frontmatter or an append
+        try:
+            with os.scandir(output_dir) as entries:
+                existing_files = {e.name for e in entries}
+        except OSError:
+            existing_files = set()
+
+        if len(items) >= PARALLEL_MIN_BOOKS:
+            # Each book is independent (own linking, filtering, and file),
+            # so fan out across cores; results come back in book order.
+            # Distinct titles can sanitize to the same filename, and
+            # those books must append to one file in order, so they are
+            # held back and written sequentially after the pool.
+            from collections import Counter
+            from concurrent.futures import ProcessPoolExecutor
+            from itertools import repeat
+
+            name_counts = Counter(
+                sanitize_filename(book_data['title']) for _, book_data in items
             )
+            pooled = [
+                (book_key, book_data) for book_key, book_data in items
+                if name_counts[sanitize_filename(book_data['title'])] == 1
+            ]
+            shared = [
+                (book_key, book_data) for book_key, book_data in items
+                if name_counts[sanitize_filename(book_data['title'])] > 1
+            ]
+
+            with ProcessPoolExecutor(
+                initializer=_init_book_pool,
+                initargs=(existing_hashes, config, existing_files)
+            ) as executor:
+                results_by_key = dict(zip(
+                    (book_key for book_key, _ in pooled),
+                    executor.map(
+                        _write_book_task,
+                        [book_data for _, book_data in pooled],
+                        repeat(output_dir),
+                        repeat(dry_run)
+                    )
+                ))
+            for book_key, book_data in shared:
+                results_by_key[book_key] = write_book_file(
+                    book_data, output_dir, existing_hashes, config, dry_run,
+                    existing_files=existing_files
+                )
+            results = [results_by_key[book_key] for book_key, _ in items]
+        else:
+            results = [
+                write_book_file(
+                    book_data, output_dir, existing_hashes, config, dry_run,
+                    existing_files=existing_files
+                )
+                for _, book_data in items
+            ]
+
+        for (book_key, book_data), (new_count, total_count, new_clippings) in zip(items, results):
             total_new += new_count
             if new_clippings:
+                if not dry_run:
+                    log(f"  {book_data['title']}: {new_count} new")
                 all_new_items.append({
                     'book_title': book_data['title'],
                     'book_author': book_data['author'],
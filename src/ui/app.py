@@ -4,7 +4,9 @@ Main application window for Kindle to Obsidian GUI.
 Assembles all UI frames into the main window with scrollable content.
 """
 
+import os
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
 
 from ..config.settings import Settings
@@ -13,6 +15,10 @@ from .formatting_frame import FormattingFrame
 from .sync_frame import SyncFrame
 
 
+# Wheel events report delta in multiples of this on Windows/macOS
+_WHEEL_STEP = 120
+
+
 class ScrollableFrame(ttk.Frame):
     """A scrollable frame container."""
     
@@ -23,12 +29,14 @@ class ScrollableFrame(ttk.Frame):
         self.canvas = tk.Canvas(self, highlightthickness=0)
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas)
-        
+
+        # Last-applied geometry, so Configure events that change
+        # nothing don't trigger relayouts
+        self._last_width = -1
+        self._last_scrollregion = None
+
         # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
         
         self.canvas_frame = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -43,27 +51,59 @@ class ScrollableFrame(ttk.Frame):
         # Bind mousewheel scrolling
         self.bind_mousewheel()
     
+    def _on_frame_configure(self, _event):
+        """Grow the scrollregion when the inner frame's size changes."""
+        region = self.canvas.bbox("all")
+        if region != self._last_scrollregion:
+            self._last_scrollregion = region
+            self.canvas.configure(scrollregion=region)
+
     def _on_canvas_configure(self, event):
         """Update the inner frame width when canvas is resized."""
+        # Tk also delivers Configure for pure scrolls on some platforms;
+        # skip the relayout when the width is unchanged
+        if event.width == self._last_width:
+            return
+        self._last_width = event.width
         self.canvas.itemconfig(self.canvas_frame, width=event.width)
     
     def bind_mousewheel(self):
-        """Bind mousewheel events for scrolling."""
-        def _on_mousewheel(event):
-            # macOS uses event.delta differently
-            if event.delta:
-                self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            else:
-                # Linux
-                if event.num == 4:
-                    self.canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    self.canvas.yview_scroll(1, "units")
-        
-        # Bind to canvas and all children
-        self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        self.canvas.bind_all("<Button-4>", _on_mousewheel)
-        self.canvas.bind_all("<Button-5>", _on_mousewheel)
+        """Bind mousewheel scrolling while the pointer is over the canvas."""
+        # The global binds only exist between Enter and Leave, so wheel
+        # events over other widgets (Spinbox, log Text) aren't stolen
+        # and don't dispatch through this handler at all
+        self.canvas.bind("<Enter>", self._activate_mousewheel)
+        self.canvas.bind("<Leave>", self._deactivate_mousewheel)
+
+    def _on_mousewheel(self, event):
+        """Scroll the canvas; skip the redraw when everything fits."""
+        yview = self.canvas.yview()
+        if yview == (0.0, 1.0):
+            return "break"
+        # Windows reports delta in multiples of the step, but macOS
+        # trackpads deliver small values (±1..±10); truncate toward
+        # zero so sub-step deltas scroll 0 units in both directions
+        # instead of floor division jumping a unit on negatives
+        d = event.delta
+        if d:
+            q = -d // _WHEEL_STEP if d < 0 else -(d // _WHEEL_STEP)
+            self.canvas.yview_scroll(q, "units")
+        elif event.num == 4:  # Linux
+            self.canvas.yview_scroll(-1, "units")
+        elif event.num == 5:
+            self.canvas.yview_scroll(1, "units")
+
+    def _activate_mousewheel(self, _event):
+        """Install the wheel handlers when the pointer enters the canvas."""
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+
+    def _deactivate_mousewheel(self, _event):
+        """Remove the wheel handlers when the pointer leaves the canvas."""
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.unbind_all("<Button-4>")
+        self.canvas.unbind_all("<Button-5>")
 
 
 class App(tk.Tk):
@@ -77,7 +117,6 @@ class App(tk.Tk):
         self.minsize(600, 400)
         
         # Center window on screen
-        self.geometry("720x650")
         self._center_window()
         
         # Load settings
@@ -92,15 +131,24 @@ class App(tk.Tk):
         
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Edits only mark the settings dirty; this tick writes the
+        # config file at most once per interval instead of per edit
+        self.after(self.AUTOSAVE_MS, self._autosave_tick)
     
+    # Initial window size; _center_window positions it from these
+    # constants so startup needs no update_idletasks geometry flush
+    WINDOW_WIDTH = 720
+    WINDOW_HEIGHT = 650
+
+    # How often dirty settings are flushed to disk
+    AUTOSAVE_MS = 5000
+
     def _center_window(self):
         """Center the window on screen."""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
+        x = (self.winfo_screenwidth() - self.WINDOW_WIDTH) // 2
+        y = (self.winfo_screenheight() - self.WINDOW_HEIGHT) // 2
+        self.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}+{x}+{y}")
     
     def _configure_styles(self):
         """Configure ttk styles."""
@@ -112,32 +160,61 @@ class App(tk.Tk):
             style.theme_use("aqua")
         elif "clam" in available_themes:
             style.theme_use("clam")
-        
+
+        # Named fonts are resolved and measured once by Tk and shared
+        # by every widget that references them by name, instead of
+        # re-resolving an inline tuple per widget
+        tkfont.Font(name="AppTitle", family="TkDefaultFont", size=18, weight="bold")
+        tkfont.Font(name="AppAccent", family="TkDefaultFont", size=12, weight="bold")
+        if os.name != "nt":
+            tkfont.Font(name="AppMono", family="Menlo", size=11)
+        else:
+            tkfont.Font(name="AppMono", family="Consolas", size=10)
+
         # Configure accent button style
-        style.configure(
-            "Accent.TButton",
-            font=("TkDefaultFont", 12, "bold")
-        )
+        style.configure("Accent.TButton", font="AppAccent")
+
+        # The sync log Treeview renders its rows in the mono font
+        style.configure("Log.Treeview", font="AppMono")
+
+        # Shared styles for the hint/preview labels and the detect
+        # status; switching style beats per-widget foreground configs
+        style.configure("Gray.TLabel", foreground="gray")
+        style.configure("Ok.TLabel", foreground="green")
+        style.configure("Err.TLabel", foreground="red")
+
+        # 1px frame used as a horizontal rule; ttk.Separator tiles a
+        # 1x1 image across its width on every resize, a flat frame
+        # is a single colored rectangle
+        style.configure("Sep.TFrame", background="#c0c0c0")
     
     def _create_widgets(self):
-        """Create the main UI layout with scrolling."""
+        """Create the main UI layout, scrolling only when the screen needs it."""
         # Configure main grid
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
-        
-        # Create scrollable container
-        self.scroll_container = ScrollableFrame(self)
-        self.scroll_container.pack(fill="both", expand=True)
-        
-        # Main content frame (inside scrollable area)
-        main_frame = ttk.Frame(self.scroll_container.scrollable_frame, padding=15)
+
+        # The content fits the default 720x650 window, so on normal
+        # screens the widgets pack straight into the toplevel — no
+        # Canvas-embedded container, no scrollregion recomputation on
+        # every child layout. Short screens keep the scrollable path.
+        if self.winfo_screenheight() >= 700:
+            container = ttk.Frame(self)
+            container.pack(fill="both", expand=True)
+        else:
+            self.scroll_container = ScrollableFrame(self)
+            self.scroll_container.pack(fill="both", expand=True)
+            container = self.scroll_container.scrollable_frame
+
+        # Main content frame
+        main_frame = ttk.Frame(container, padding=15)
         main_frame.pack(fill="both", expand=True)
         
         # Title
         title_label = ttk.Label(
             main_frame,
             text="Kindle to Obsidian",
-            font=("TkDefaultFont", 18, "bold")
+            font="AppTitle"
         )
         title_label.pack(pady=(0, 15))
         
@@ -177,9 +254,16 @@ class App(tk.Tk):
         # Refresh previews to show updated counts
         self.paths_frame.refresh_previews()
     
+    def _autosave_tick(self):
+        """Periodic autosave: persist settings only when dirty."""
+        self.settings.save_if_dirty()
+        self.after(self.AUTOSAVE_MS, self._autosave_tick)
+
     def _on_close(self):
         """Handle window close."""
-        # Save settings before closing
+        # Apply any queued edits, then persist once before closing
+        self.paths_frame.cancel_pending_save()
+        self.formatting_frame.cancel_pending_save()
         self.settings.save()
         self.destroy()
     
@@ -4,16 +4,22 @@ Formatting options frame for Kindle to Obsidian GUI.
 Provides controls for customizing output format.
 """
 
+import weakref
+
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from ..config.settings import Settings
 
 
 class FormattingFrame(ttk.LabelFrame):
     """Frame for formatting and output options."""
-    
+
+    # Delay before an edit is persisted; a burst of changes within this
+    # window results in a single disk write
+    SAVE_DELAY_MS = 300
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -21,10 +27,18 @@ class FormattingFrame(ttk.LabelFrame):
         on_change: Optional[Callable[[], None]] = None
     ):
         super().__init__(parent, text="Formatting Options", padding=10)
-        
+
         self.settings = settings
-        self.on_change = on_change
-        
+        # Bound-method callbacks are held weakly so the frame doesn't
+        # pin its owner in a reference cycle once it is torn down
+        if on_change is None:
+            self._on_change_ref = lambda: None
+        elif hasattr(on_change, '__self__'):
+            self._on_change_ref = weakref.WeakMethod(on_change)
+        else:
+            self._on_change_ref = lambda cb=on_change: cb
+        self._save_after_id = None
+
         # Variables
         self.min_highlights_var = tk.IntVar()
         self.short_notes_filename_var = tk.StringVar()
@@ -37,7 +51,23 @@ class FormattingFrame(ttk.LabelFrame):
         
         self._create_widgets()
         self._load_from_settings()
-    
+
+        # One write-trace per variable replaces the per-widget FocusOut/
+        # Return bindings; whichever field changes, the same dispatcher
+        # queues it and arms a single debounced flush
+        self._pending: Dict[Tuple[str, str], tk.Variable] = {}
+        for key, var in (
+            (('output', 'min_highlights_for_own_file'), self.min_highlights_var),
+            (('output', 'short_notes_filename'), self.short_notes_filename_var),
+            (('output', 'default_tag'), self.default_tag_var),
+            (('output', 'short_notes_tag'), self.short_notes_tag_var),
+            (('frontmatter', 'include_author'), self.include_author_var),
+            (('frontmatter', 'include_tags'), self.include_tags_var),
+            (('output', 'create_import_log'), self.create_import_log_var),
+            (('output', 'import_log_folder'), self.import_log_folder_var),
+        ):
+            var.trace_add('write', lambda *_, k=key, v=var: self._schedule_save(k, v))
+
     def _create_widgets(self):
         """Create the UI widgets."""
         # Configure grid
@@ -58,16 +88,14 @@ class FormattingFrame(ttk.LabelFrame):
             from_=1,
             to=100,
             width=5,
-            textvariable=self.min_highlights_var,
-            command=self._on_min_highlights_change
+            textvariable=self.min_highlights_var
         )
         self.min_highlights_spinbox.grid(row=0, column=0)
-        self.min_highlights_spinbox.bind('<FocusOut>', lambda e: self._on_min_highlights_change())
         
         ttk.Label(
             min_frame,
             text="(books with fewer go to short notes file)",
-            foreground="gray"
+            style="Gray.TLabel"
         ).grid(row=0, column=1, padx=(10, 0))
         
         row += 1
@@ -86,13 +114,15 @@ class FormattingFrame(ttk.LabelFrame):
             width=25
         )
         self.short_notes_entry.grid(row=0, column=0)
-        self.short_notes_entry.bind('<FocusOut>', lambda e: self._on_short_notes_filename_change())
-        self.short_notes_entry.bind('<Return>', lambda e: self._on_short_notes_filename_change())
+        # The stored filename gets its .md suffix in _flush_pending;
+        # the Entry itself is only synced to it once focus leaves, so
+        # text is never rewritten under the cursor mid-edit
+        self.short_notes_entry.bind('<FocusOut>', self._sync_short_notes_display)
         
         row += 1
         
         # Separator
-        ttk.Separator(self, orient="horizontal").grid(
+        ttk.Frame(self, height=1, style="Sep.TFrame").grid(
             row=row, column=0, columnspan=2, sticky="ew", pady=10
         )
         
@@ -112,13 +142,11 @@ class FormattingFrame(ttk.LabelFrame):
             width=20
         )
         self.default_tag_entry.grid(row=0, column=0)
-        self.default_tag_entry.bind('<FocusOut>', lambda e: self._on_default_tag_change())
-        self.default_tag_entry.bind('<Return>', lambda e: self._on_default_tag_change())
         
         ttk.Label(
             tag_frame,
             text="(applied to all book files)",
-            foreground="gray"
+            style="Gray.TLabel"
         ).grid(row=0, column=1, padx=(10, 0))
         
         row += 1
@@ -137,19 +165,17 @@ class FormattingFrame(ttk.LabelFrame):
             width=20
         )
         self.short_notes_tag_entry.grid(row=0, column=0)
-        self.short_notes_tag_entry.bind('<FocusOut>', lambda e: self._on_short_notes_tag_change())
-        self.short_notes_tag_entry.bind('<Return>', lambda e: self._on_short_notes_tag_change())
         
         ttk.Label(
             short_tag_frame,
             text="(additional tag for short notes)",
-            foreground="gray"
+            style="Gray.TLabel"
         ).grid(row=0, column=1, padx=(10, 0))
         
         row += 1
         
         # Separator
-        ttk.Separator(self, orient="horizontal").grid(
+        ttk.Frame(self, height=1, style="Sep.TFrame").grid(
             row=row, column=0, columnspan=2, sticky="ew", pady=10
         )
         
@@ -166,23 +192,21 @@ class FormattingFrame(ttk.LabelFrame):
         self.include_author_check = ttk.Checkbutton(
             frontmatter_frame,
             text="Include author",
-            variable=self.include_author_var,
-            command=self._on_include_author_change
+            variable=self.include_author_var
         )
         self.include_author_check.grid(row=0, column=0, sticky="w")
         
         self.include_tags_check = ttk.Checkbutton(
             frontmatter_frame,
             text="Include tags",
-            variable=self.include_tags_var,
-            command=self._on_include_tags_change
+            variable=self.include_tags_var
         )
         self.include_tags_check.grid(row=1, column=0, sticky="w")
         
         row += 1
         
         # Separator
-        ttk.Separator(self, orient="horizontal").grid(
+        ttk.Frame(self, height=1, style="Sep.TFrame").grid(
             row=row, column=0, columnspan=2, sticky="ew", pady=10
         )
         
@@ -199,15 +223,14 @@ class FormattingFrame(ttk.LabelFrame):
         self.create_import_log_check = ttk.Checkbutton(
             import_log_frame,
             text="Create import log for each sync",
-            variable=self.create_import_log_var,
-            command=self._on_create_import_log_change
+            variable=self.create_import_log_var
         )
         self.create_import_log_check.grid(row=0, column=0, sticky="w", columnspan=2)
         
         ttk.Label(
             import_log_frame,
             text="(tracks new highlights per sync)",
-            foreground="gray"
+            style="Gray.TLabel"
         ).grid(row=0, column=2, padx=(10, 0))
         
         row += 1
@@ -226,13 +249,11 @@ class FormattingFrame(ttk.LabelFrame):
             width=20
         )
         self.import_log_folder_entry.grid(row=0, column=0)
-        self.import_log_folder_entry.bind('<FocusOut>', lambda e: self._on_import_log_folder_change())
-        self.import_log_folder_entry.bind('<Return>', lambda e: self._on_import_log_folder_change())
         
         ttk.Label(
             import_folder_frame,
             text="(subfolder in output directory)",
-            foreground="gray"
+            style="Gray.TLabel"
         ).grid(row=0, column=1, padx=(10, 0))
     
     def _load_from_settings(self):
@@ -262,65 +283,56 @@ class FormattingFrame(ttk.LabelFrame):
             self.settings.get('output', 'import_log_folder', default='Import Logs')
         )
     
-    def _save_and_notify(self):
-        """Save settings and notify of change."""
-        self.settings.save()
-        if self.on_change:
-            self.on_change()
-    
-    def _on_min_highlights_change(self):
-        """Handle min highlights change."""
-        try:
-            value = self.min_highlights_var.get()
-            if value >= 1:
-                self.settings.set('output', 'min_highlights_for_own_file', value)
-                self._save_and_notify()
-        except tk.TclError:
-            pass  # Invalid value, ignore
-    
-    def _on_short_notes_filename_change(self):
-        """Handle short notes filename change."""
-        value = self.short_notes_filename_var.get().strip()
-        if value:
-            if not value.endswith('.md'):
+    def _schedule_save(self, key: Tuple[str, str], var: tk.Variable):
+        """Queue a changed variable and (re)arm the debounced flush."""
+        self._pending[key] = var
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(self.SAVE_DELAY_MS, self._do_flush)
+
+    def _flush_pending(self) -> bool:
+        """Validate and apply queued edits; return whether anything changed."""
+        pending, self._pending = self._pending, {}
+        changed = False
+        for (section, key), var in pending.items():
+            try:
+                value = var.get()
+            except tk.TclError:
+                continue  # e.g. Spinbox cleared mid-edit
+            if isinstance(value, str):
+                value = value.strip()
+                if not value:
+                    continue
+            if key == 'min_highlights_for_own_file' and value < 1:
+                continue
+            if key == 'short_notes_filename' and not value.endswith('.md'):
                 value += '.md'
-                self.short_notes_filename_var.set(value)
-            self.settings.set('output', 'short_notes_filename', value)
-            self._save_and_notify()
-    
-    def _on_default_tag_change(self):
-        """Handle default tag change."""
-        value = self.default_tag_var.get().strip()
-        if value:
-            self.settings.set('output', 'default_tag', value)
-            self._save_and_notify()
-    
-    def _on_short_notes_tag_change(self):
-        """Handle short notes tag change."""
-        value = self.short_notes_tag_var.get().strip()
-        if value:
-            self.settings.set('output', 'short_notes_tag', value)
-            self._save_and_notify()
-    
-    def _on_include_author_change(self):
-        """Handle include author checkbox change."""
-        self.settings.set('frontmatter', 'include_author', self.include_author_var.get())
-        self._save_and_notify()
-    
-    def _on_include_tags_change(self):
-        """Handle include tags checkbox change."""
-        self.settings.set('frontmatter', 'include_tags', self.include_tags_var.get())
-        self._save_and_notify()
-    
-    def _on_create_import_log_change(self):
-        """Handle create import log checkbox change."""
-        self.settings.set('output', 'create_import_log', self.create_import_log_var.get())
-        self._save_and_notify()
-    
-    def _on_import_log_folder_change(self):
-        """Handle import log folder name change."""
-        value = self.import_log_folder_var.get().strip()
-        if value:
-            self.settings.set('output', 'import_log_folder', value)
-            self._save_and_notify()
+            if value != self.settings.get(section, key):
+                self.settings.set(section, key, value)
+                changed = True
+        return changed
+
+    def _sync_short_notes_display(self, event=None):
+        """Sync the Entry to the normalized stored filename after editing."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._do_flush()
+        stored = self.settings.get('output', 'short_notes_filename')
+        if stored and self.short_notes_filename_var.get().strip() != stored:
+            self.short_notes_filename_var.set(stored)
+
+    def _do_flush(self):
+        """Apply queued edits; the app's periodic autosave persists them."""
+        self._save_after_id = None
+        if self._flush_pending():
+            on_change = self._on_change_ref()
+            if on_change:
+                on_change()
+
+    def cancel_pending_save(self):
+        """Drop the scheduled flush but apply queued edits; the caller saves."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._flush_pending()
 
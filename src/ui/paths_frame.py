@@ -5,16 +5,22 @@ Provides file/folder selection with preview information.
 """
 
 import os
+import threading
+import weakref
 import tkinter as tk
 from tkinter import filedialog, ttk
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from ..config.settings import Settings
 
 
 class PathsFrame(ttk.LabelFrame):
     """Frame for selecting input clippings file and output directory."""
-    
+
+    # Delay before an edit is persisted; a burst of changes within this
+    # window results in a single disk write
+    SAVE_DELAY_MS = 300
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -22,19 +28,45 @@ class PathsFrame(ttk.LabelFrame):
         on_change: Optional[Callable[[], None]] = None
     ):
         super().__init__(parent, text="Paths", padding=10)
-        
+
         self.settings = settings
-        self.on_change = on_change
-        
+        # Bound-method callbacks are held weakly so the frame doesn't
+        # pin its owner in a reference cycle once it is torn down
+        if on_change is None:
+            self._on_change_ref = lambda: None
+        elif hasattr(on_change, '__self__'):
+            self._on_change_ref = weakref.WeakMethod(on_change)
+        else:
+            self._on_change_ref = lambda cb=on_change: cb
+        self._save_after_id = None
+        # Monotonic token so stale background preview results are dropped
+        self._preview_token = 0
+
         # Variables
         self.clippings_var = tk.StringVar()
         self.output_var = tk.StringVar()
         self.clippings_preview_var = tk.StringVar(value="No file selected")
         self.output_preview_var = tk.StringVar(value="No folder selected")
+        self._detect_status_var = tk.StringVar()
         
         self._create_widgets()
         self._load_from_settings()
-    
+
+        # One write-trace per path variable replaces the FocusOut/Return
+        # bindings; Browse, auto-detect, and typing all funnel through
+        # the same debounced dispatcher
+        self._pending: Dict[Tuple[str, str], tk.Variable] = {}
+        for key, var in (
+            (('paths', 'kindle_clippings'), self.clippings_var),
+            (('paths', 'output_directory'), self.output_var),
+        ):
+            var.trace_add('write', lambda *_, k=key, v=var: self._schedule_save(k, v))
+
+        # Priming the entries above is cheap; the preview scans touch
+        # the filesystem, so they wait until after the first paint
+        self.after_idle(self._update_clippings_preview)
+        self.after_idle(self._update_output_preview)
+
     def _create_widgets(self):
         """Create the UI widgets."""
         # Configure grid
@@ -55,8 +87,6 @@ class PathsFrame(ttk.LabelFrame):
             width=50
         )
         self.clippings_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
-        self.clippings_entry.bind('<FocusOut>', lambda e: self._on_clippings_change())
-        self.clippings_entry.bind('<Return>', lambda e: self._on_clippings_change())
         
         ttk.Button(
             clippings_frame,
@@ -69,7 +99,7 @@ class PathsFrame(ttk.LabelFrame):
         self.clippings_preview = ttk.Label(
             self,
             textvariable=self.clippings_preview_var,
-            foreground="gray"
+            style="Gray.TLabel"
         )
         self.clippings_preview.grid(row=1, column=1, sticky="w", pady=(0, 10))
         
@@ -77,13 +107,18 @@ class PathsFrame(ttk.LabelFrame):
         detect_frame = ttk.Frame(self)
         detect_frame.grid(row=2, column=1, sticky="w", pady=(0, 10))
         
-        ttk.Button(
+        self.detect_button = ttk.Button(
             detect_frame,
             text="Auto-detect Kindle",
             command=self._auto_detect_kindle
-        ).pack(side="left")
+        )
+        self.detect_button.pack(side="left")
         
-        self.detect_status = ttk.Label(detect_frame, text="", foreground="gray")
+        self.detect_status = ttk.Label(
+            detect_frame,
+            textvariable=self._detect_status_var,
+            style="Gray.TLabel"
+        )
         self.detect_status.pack(side="left", padx=(10, 0))
         
         # Output folder row
@@ -101,8 +136,6 @@ class PathsFrame(ttk.LabelFrame):
             width=50
         )
         self.output_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
-        self.output_entry.bind('<FocusOut>', lambda e: self._on_output_change())
-        self.output_entry.bind('<Return>', lambda e: self._on_output_change())
         
         ttk.Button(
             output_frame,
@@ -115,20 +148,17 @@ class PathsFrame(ttk.LabelFrame):
         self.output_preview = ttk.Label(
             self,
             textvariable=self.output_preview_var,
-            foreground="gray"
+            style="Gray.TLabel"
         )
         self.output_preview.grid(row=4, column=1, sticky="w", pady=(0, 5))
     
     def _load_from_settings(self):
-        """Load paths from settings."""
+        """Load paths from settings into the entry variables."""
         clippings = self.settings.get('paths', 'kindle_clippings', default='')
         output = self.settings.get('paths', 'output_directory', default='')
-        
+
         self.clippings_var.set(clippings)
         self.output_var.set(output)
-        
-        self._update_clippings_preview()
-        self._update_output_preview()
     
     def _browse_clippings(self):
         """Open file dialog for clippings file."""
@@ -145,7 +175,6 @@ class PathsFrame(ttk.LabelFrame):
         
         if filepath:
             self.clippings_var.set(filepath)
-            self._on_clippings_change()
     
     def _browse_output(self):
         """Open folder dialog for output directory."""
@@ -158,55 +187,103 @@ class PathsFrame(ttk.LabelFrame):
         
         if folderpath:
             self.output_var.set(folderpath)
-            self._on_output_change()
     
     def _auto_detect_kindle(self):
-        """Try to auto-detect connected Kindle."""
+        """Kick off Kindle detection on a worker thread."""
+        # Drive probes can block for hundreds of ms while media spins
+        # up, so the scan runs off the Tk thread like the sync does
+        self.detect_button.configure(state="disabled")
+        self.detect_status.configure(style="Gray.TLabel")
+        self._detect_status_var.set("Searching...")
+        threading.Thread(target=self._bg_detect, daemon=True).start()
+
+    def _bg_detect(self):
+        """Background worker: probe for a Kindle and post the result back."""
         detected = self.settings.detect_kindle()
-        
+        self.after(0, self._apply_detect, detected)
+
+    def _apply_detect(self, detected: Optional[str]):
+        """Show the detection result and re-enable the button."""
+        self.detect_button.configure(state="normal")
         if detected:
             self.clippings_var.set(detected)
-            self._on_clippings_change()
-            self.detect_status.config(text="Found!", foreground="green")
+            self.detect_status.configure(style="Ok.TLabel")
+            self._detect_status_var.set("Found!")
         else:
-            self.detect_status.config(text="Not found", foreground="red")
+            self.detect_status.configure(style="Err.TLabel")
+            self._detect_status_var.set("Not found")
         
         # Clear status after 3 seconds
-        self.after(3000, lambda: self.detect_status.config(text=""))
-    
-    def _on_clippings_change(self):
-        """Handle clippings path change."""
-        path = self.clippings_var.get()
-        self.settings.set('paths', 'kindle_clippings', path)
-        self.settings.save()
-        self._update_clippings_preview()
-        
-        if self.on_change:
-            self.on_change()
-    
-    def _on_output_change(self):
-        """Handle output path change."""
-        path = self.output_var.get()
-        self.settings.set('paths', 'output_directory', path)
-        self.settings.save()
-        self._update_output_preview()
-        
-        if self.on_change:
-            self.on_change()
+        self.after(3000, self._detect_status_var.set, "")
     
+    def _schedule_save(self, key: Tuple[str, str], var: tk.Variable):
+        """Queue a changed variable and (re)arm the debounced flush."""
+        self._pending[key] = var
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(self.SAVE_DELAY_MS, self._do_flush)
+
+    def _flush_pending(self) -> bool:
+        """Apply queued path edits; return whether anything changed."""
+        pending, self._pending = self._pending, {}
+        changed = False
+        for (section, key), var in pending.items():
+            value = var.get()
+            if value == self.settings.get(section, key):
+                continue
+            self.settings.set(section, key, value)
+            changed = True
+            if key == 'kindle_clippings':
+                self._update_clippings_preview()
+            else:
+                self._update_output_preview()
+        return changed
+
+    def _do_flush(self):
+        """Apply queued edits; the app's periodic autosave persists them."""
+        self._save_after_id = None
+        if self._flush_pending():
+            on_change = self._on_change_ref()
+            if on_change:
+                on_change()
+
+    def cancel_pending_save(self):
+        """Drop the scheduled flush but apply queued edits; the caller saves."""
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._flush_pending()
+
     def _update_clippings_preview(self):
         """Update the clippings file preview text."""
         path = self.settings.get_expanded_path('paths', 'kindle_clippings')
-        
+        self._preview_token += 1
+        token = self._preview_token
+
         if not path:
             self.clippings_preview_var.set("No file selected")
             return
-        
+
         if not os.path.isfile(path):
             self.clippings_preview_var.set("File not found")
             return
-        
+
+        # Scan off the Tk thread; a multi-MB clippings file would
+        # otherwise freeze the UI for the duration of the parse
+        self.clippings_preview_var.set("Scanning...")
+        threading.Thread(
+            target=self._bg_clippings_preview, args=(token,), daemon=True
+        ).start()
+
+    def _bg_clippings_preview(self, token: int):
+        """Background worker: compute the preview and post it back."""
         preview = self.settings.get_clippings_preview()
+        self.after(0, self._apply_clippings_preview, token, preview)
+
+    def _apply_clippings_preview(self, token: int, preview: dict):
+        """Show a background preview result unless a newer request superseded it."""
+        if token != self._preview_token:
+            return
         self.clippings_preview_var.set(
             f"Found {preview['books']} books, {preview['highlights']} highlights"
         )
@@ -238,6 +315,10 @@ class PathsFrame(ttk.LabelFrame):
     
     def refresh_previews(self):
         """Refresh both preview texts."""
+        # A sync may rewrite files without touching the directory mtime,
+        # so force the output preview to rescan; the clippings file is
+        # unchanged and keeps its cache
+        self.settings.invalidate_output_preview()
         self._update_clippings_preview()
         self._update_output_preview()
 
@@ -5,7 +5,9 @@ Provides sync button and log output display.
 """
 
 import os
+import queue
 import threading
+import weakref
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Callable, Optional
@@ -16,7 +18,19 @@ from ..core.writer import sync_highlights
 
 class SyncFrame(ttk.Frame):
     """Frame for sync button and output log."""
-    
+
+    # How often queued log lines are flushed into the Text widget
+    LOG_DRAIN_MS = 50
+
+    # Oldest lines are dropped past this point so inserts and
+    # scrolling stay O(cap) on very long syncs
+    MAX_LOG_LINES = 5000
+
+    # The Treeview log appends without recomputing wrap metrics per
+    # line; set to True to restore the selectable tk.Text widget at the
+    # cost of slower inserts on long syncs
+    USE_TEXT_LOG = False
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -30,11 +44,23 @@ class SyncFrame(ttk.Frame):
         self.settings = settings
         self.get_clippings_path = get_clippings_path
         self.get_output_path = get_output_path
-        self.on_sync_complete = on_sync_complete
+        # Bound-method callbacks are held weakly so the frame doesn't
+        # pin its owner in a reference cycle once it is torn down
+        if on_sync_complete is None:
+            self._on_sync_complete_ref = lambda: None
+        elif hasattr(on_sync_complete, '__self__'):
+            self._on_sync_complete_ref = weakref.WeakMethod(on_sync_complete)
+        else:
+            self._on_sync_complete_ref = lambda cb=on_sync_complete: cb
         
         self._is_syncing = False
-        
+        self._log_queue: queue.Queue = queue.Queue()
+
         self._create_widgets()
+
+        # One periodic pump inserts queued lines in batches, instead of
+        # one Tk event and one Text reflow per log line
+        self._drain_after_id = self.after(self.LOG_DRAIN_MS, self._drain_log_queue)
     
     def _create_widgets(self):
         """Create the UI widgets."""
@@ -67,24 +93,39 @@ class SyncFrame(ttk.Frame):
         log_frame.columnconfigure(0, weight=1)
         log_frame.rowconfigure(0, weight=1)
         
-        # Log text with scrollbar
-        self.log_text = tk.Text(
-            log_frame,
-            height=10,
-            width=60,
-            wrap="word",
-            state="disabled",
-            font=("Menlo", 11) if os.name != "nt" else ("Consolas", 10)
-        )
-        self.log_text.grid(row=0, column=0, sticky="nsew")
+        # Log widget with scrollbar
+        if self.USE_TEXT_LOG:
+            self.log_widget = self.log_text = tk.Text(
+                log_frame,
+                height=10,
+                width=60,
+                wrap="word",
+                font="AppMono"  # named font registered by App._configure_styles
+            )
+            # Read-only via bindings rather than state="disabled":
+            # user edits are swallowed here, so appends don't need a
+            # configure(state=...) round-trip on either side
+            self.log_text.bind("<Key>", lambda e: "break")
+            self.log_text.bind("<<Paste>>", lambda e: "break")
+            self.log_text.bind("<Button-2>", lambda e: "break")
+        else:
+            self.log_widget = self.log_list = ttk.Treeview(
+                log_frame,
+                columns=("message",),
+                show="",
+                height=10,
+                style="Log.Treeview"
+            )
+            self.log_list.column("message", stretch=True)
+        self.log_widget.grid(row=0, column=0, sticky="nsew")
         
         scrollbar = ttk.Scrollbar(
             log_frame,
             orient="vertical",
-            command=self.log_text.yview
+            command=self.log_widget.yview
         )
         scrollbar.grid(row=0, column=1, sticky="ns")
-        self.log_text.configure(yscrollcommand=scrollbar.set)
+        self.log_widget.configure(yscrollcommand=scrollbar.set)
         
         # Clear button
         clear_button = ttk.Button(
@@ -147,11 +188,12 @@ class SyncFrame(ttk.Frame):
                     log_callback=self._log_threadsafe
                 )
                 
-                # Notify completion on main thread
-                self.after(0, lambda: self._on_sync_finished(result, None))
+                # Notify completion on main thread; after() forwards
+                # positional args itself, no closure needed
+                self.after(0, self._on_sync_finished, result, None)
                 
             except Exception as e:
-                self.after(0, lambda: self._on_sync_finished(None, str(e)))
+                self.after(0, self._on_sync_finished, None, str(e))
         
         thread = threading.Thread(target=run_sync, daemon=True)
         thread.start()
@@ -160,6 +202,9 @@ class SyncFrame(ttk.Frame):
         """Handle sync completion."""
         self._is_syncing = False
         self._set_ui_syncing(False)
+
+        # Flush any queued worker lines first so the summary stays in order
+        self._flush_log_queue()
         
         if error:
             self._log("")
@@ -174,8 +219,9 @@ class SyncFrame(ttk.Frame):
                 self._log(f"  New highlights: {result['new_highlights']}")
         
         # Notify callback
-        if self.on_sync_complete:
-            self.on_sync_complete()
+        on_sync_complete = self._on_sync_complete_ref()
+        if on_sync_complete:
+            on_sync_complete()
     
     def _set_ui_syncing(self, syncing: bool):
         """Update UI state for syncing."""
@@ -190,18 +236,54 @@ class SyncFrame(ttk.Frame):
     
     def _log(self, message: str):
         """Add a message to the log (must be called from main thread)."""
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", message + "\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
+        self._append_lines([message])
+
+    def _append_lines(self, lines):
+        """Append lines to whichever log widget is active and scroll down."""
+        if self.USE_TEXT_LOG:
+            self.log_text.insert("end", "\n".join(lines) + "\n")
+            self._trim_log()
+            self.log_text.see("end")
+        else:
+            insert = self.log_list.insert
+            for line in lines:
+                insert("", "end", values=(line,))
+            children = self.log_list.get_children()
+            if len(children) > self.MAX_LOG_LINES:
+                self.log_list.delete(*children[:len(children) - self.MAX_LOG_LINES])
+                children = self.log_list.get_children()
+            self.log_list.see(children[-1])
+
+    def _trim_log(self):
+        """Drop the oldest Text lines once past the cap."""
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            self.log_text.delete('1.0', f'{line_count - self.MAX_LOG_LINES + 1}.0')
     
     def _log_threadsafe(self, message: str):
-        """Add a message to the log from any thread."""
-        self.after(0, lambda: self._log(message))
+        """Queue a log message from any thread; the pump inserts it."""
+        self._log_queue.put(message)
+
+    def _flush_log_queue(self):
+        """Insert all queued log lines with a single Text operation."""
+        items = []
+        try:
+            while len(items) < 500:
+                items.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if items:
+            self._append_lines(items)
+
+    def _drain_log_queue(self):
+        """Periodic pump: flush queued lines and reschedule."""
+        self._flush_log_queue()
+        self._drain_after_id = self.after(self.LOG_DRAIN_MS, self._drain_log_queue)
     
     def _clear_log(self):
-        """Clear the log text."""
-        self.log_text.configure(state="normal")
-        self.log_text.delete("1.0", "end")
-        self.log_text.configure(state="disabled")
+        """Clear the log."""
+        if self.USE_TEXT_LOG:
+            self.log_text.delete("1.0", "end")
+        else:
+            self.log_list.delete(*self.log_list.get_children())
 